@@ -1,6 +1,7 @@
 import contextlib
 import copy
 import difflib
+import functools
 import importlib
 import importlib.util
 import re
@@ -13,6 +14,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Set,
     SupportsFloat,
     Tuple,
     Union,
@@ -63,6 +65,7 @@ def load(name: str) -> callable:
     return fn
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_env_id(id: str) -> Tuple[Optional[str], str, Optional[int]]:
     """Parse environment ID string format.
 
@@ -160,13 +163,99 @@ class EnvSpec:
         return make(self, **kwargs)
 
 
+class EnvRegistry(Dict[str, EnvSpec]):
+    """The mapping of environment ids to :class:`EnvSpec` used as the global registry.
+
+    This behaves as a plain ``dict`` keyed by environment id. In addition, the specs are indexed by
+    ``(namespace, name)`` so that version lookups only visit the versions of a single environment.
+    Every mutating method keeps the index in sync, including ``del registry[env_id]`` and ``registry.pop(env_id)``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialises the registry, optionally with existing ``env_id: EnvSpec`` pairs like ``dict``."""
+        super().__init__()
+        self._env_specs_by_name: Dict[
+            Tuple[Optional[str], str], Dict[str, EnvSpec]
+        ] = {}
+        self.update(*args, **kwargs)
+
+    def env_specs(self, ns: Optional[str], name: str) -> List[EnvSpec]:
+        """Returns the registered specs (of every version) for the environment ``name`` in namespace ``ns``."""
+        return list(self._env_specs_by_name.get((ns, name), {}).values())
+
+    def namespaces(self) -> Set[str]:
+        """Returns the namespaces of the registered environments."""
+        return {ns for ns, _ in self._env_specs_by_name if ns is not None}
+
+    def names(self, ns: Optional[str]) -> Set[str]:
+        """Returns the names of the registered environments in namespace ``ns``."""
+        return {name for ns_, name in self._env_specs_by_name if ns_ == ns}
+
+    def _add_to_index(self, env_id: str, spec_: EnvSpec):
+        key = (spec_.namespace, spec_.name)
+        self._env_specs_by_name.setdefault(key, {})[env_id] = spec_
+
+    def _remove_from_index(self, env_id: str, spec_: EnvSpec):
+        key = (spec_.namespace, spec_.name)
+        env_specs = self._env_specs_by_name[key]
+        del env_specs[env_id]
+        if not env_specs:
+            del self._env_specs_by_name[key]
+
+    def __setitem__(self, env_id: str, spec_: EnvSpec):
+        if env_id in self:
+            self._remove_from_index(env_id, self[env_id])
+        super().__setitem__(env_id, spec_)
+        self._add_to_index(env_id, spec_)
+
+    def __delitem__(self, env_id: str):
+        spec_ = self[env_id]
+        super().__delitem__(env_id)
+        self._remove_from_index(env_id, spec_)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    def pop(self, env_id: str, *default):
+        """Removes ``env_id`` and returns its spec, or ``default`` if given and ``env_id`` is not registered."""
+        if env_id not in self:
+            return super().pop(env_id, *default)
+        spec_ = super().pop(env_id)
+        self._remove_from_index(env_id, spec_)
+        return spec_
+
+    def popitem(self) -> Tuple[str, EnvSpec]:
+        """Removes and returns the most recently registered ``(env_id, spec)`` pair."""
+        env_id, spec_ = super().popitem()
+        self._remove_from_index(env_id, spec_)
+        return env_id, spec_
+
+    def clear(self):
+        """Removes every environment from the registry."""
+        super().clear()
+        self._env_specs_by_name.clear()
+
+    def update(self, *args, **kwargs):
+        """Registers every ``env_id: EnvSpec`` pair given, like ``dict.update``."""
+        for env_id, spec_ in dict(*args, **kwargs).items():
+            self[env_id] = spec_
+
+    def setdefault(self, env_id: str, default: EnvSpec) -> EnvSpec:
+        """Returns the spec of ``env_id``, registering ``default`` under it first if missing."""
+        if env_id not in self:
+            self[env_id] = default
+        return self[env_id]
+
+
 def _check_namespace_exists(ns: Optional[str]):
     """Check if a namespace exists. If it doesn't, print a helpful error message."""
     if ns is None:
         return
-    namespaces = {
-        spec_.namespace for spec_ in registry.values() if spec_.namespace is not None
-    }
+    namespaces = registry.namespaces()
     if ns in namespaces:
         return
 
@@ -185,7 +274,7 @@ def _check_namespace_exists(ns: Optional[str]):
 def _check_name_exists(ns: Optional[str], name: str):
     """Check if an env exists in a namespace. If it doesn't, print a helpful error message."""
     _check_namespace_exists(ns)
-    names = {spec_.name for spec_ in registry.values() if spec_.namespace == ns}
+    names = registry.names(ns)
 
     if name in names:
         return
@@ -222,12 +311,9 @@ def _check_version_exists(ns: Optional[str], name: str, version: Optional[int]):
 
     message = f"Environment version `v{version}` for environment `{get_env_id(ns, name, None)}` doesn't exist."
 
-    env_specs = [
-        spec_
-        for spec_ in registry.values()
-        if spec_.namespace == ns and spec_.name == name
-    ]
-    env_specs = sorted(env_specs, key=lambda spec_: int(spec_.version or -1))
+    env_specs = sorted(
+        registry.env_specs(ns, name), key=lambda spec_: int(spec_.version or -1)
+    )
 
     default_spec = [spec_ for spec_ in env_specs if spec_.version is None]
 
@@ -257,8 +343,8 @@ def _check_version_exists(ns: Optional[str], name: str, version: Optional[int]):
 def find_highest_version(ns: Optional[str], name: str) -> Optional[int]:
     version: List[int] = [
         spec_.version
-        for spec_ in registry.values()
-        if spec_.namespace == ns and spec_.name == name and spec_.version is not None
+        for spec_ in registry.env_specs(ns, name)
+        if spec_.version is not None
     ]
     return max(version, default=None)
 
@@ -372,33 +458,22 @@ def make(id: Literal[
 
 
 # Global registry of environments. Meant to be accessed through `register` and `make`
-registry: Dict[str, EnvSpec] = {}
+registry: EnvRegistry = EnvRegistry()
 current_namespace: Optional[str] = None
 
 
 def _check_spec_register(spec: EnvSpec):
     """Checks whether the spec is valid to be registered. Helper function for `register`."""
     global registry
+    env_specs = registry.env_specs(spec.namespace, spec.name)
     latest_versioned_spec = max(
-        (
-            spec_
-            for spec_ in registry.values()
-            if spec_.namespace == spec.namespace
-            and spec_.name == spec.name
-            and spec_.version is not None
-        ),
+        (spec_ for spec_ in env_specs if spec_.version is not None),
         key=lambda spec_: int(spec_.version),  # type: ignore
         default=None,
     )
 
     unversioned_spec = next(
-        (
-            spec_
-            for spec_ in registry.values()
-            if spec_.namespace == spec.namespace
-            and spec_.name == spec.name
-            and spec_.version is None
-        ),
+        (spec_ for spec_ in env_specs if spec_.version is None),
         None,
     )
 
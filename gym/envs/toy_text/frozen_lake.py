@@ -8,6 +8,7 @@ import numpy as np
 from gym import Env, logger, spaces, utils
 from gym.envs.toy_text.utils import categorical_sample
 from gym.error import DependencyNotInstalled
+from gym.utils import seeding
 
 LEFT = 0
 DOWN = 1
@@ -50,22 +51,26 @@ def is_valid(board: List[List[str]], max_size: int) -> bool:
     return False
 
 
-def generate_random_map(size: int = 8, p: float = 0.8) -> List[str]:
+def generate_random_map(
+    size: int = 8, p: float = 0.8, seed: Optional[int] = None
+) -> List[str]:
     """Generates a random valid map (one that has a path from start to goal)
 
     Args:
         size: size of each side of the grid
         p: probability that a tile is frozen
+        seed: optional seed to ensure the generation of reproducible maps
 
     Returns:
         A random valid map
     """
     valid = False
     board = []  # initialize to make pyright happy
+    np_random, _ = seeding.np_random(seed)
 
     while not valid:
         p = min(1, p)
-        board = np.random.choice(["F", "H"], (size, size), p=[p, 1 - p])
+        board = np_random.choice(["F", "H"], (size, size), p=[p, 1 - p])
         board[0][0] = "S"
         board[-1][-1] = "G"
         valid = is_valid(board, size)
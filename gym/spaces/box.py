@@ -101,10 +101,15 @@ class Box(Space[np.ndarray]):
             )
 
         # Capture the boundedness information before replacing np.inf with get_inf
-        _low = np.full(shape, low, dtype=float) if is_float_integer(low) else low
-        self.bounded_below = -np.inf < _low
-        _high = np.full(shape, high, dtype=float) if is_float_integer(high) else high
-        self.bounded_above = np.inf > _high
+        # Scalar bounds are broadcast into new arrays of `dtype` so do not need to be copied again
+        low_is_scalar, high_is_scalar = is_float_integer(low), is_float_integer(high)
+        bounded_below, bounded_above = -np.inf < low, np.inf > high
+        self.bounded_below = (
+            np.full(shape, bounded_below) if low_is_scalar else bounded_below
+        )
+        self.bounded_above = (
+            np.full(shape, bounded_above) if high_is_scalar else bounded_above
+        )
 
         low = _broadcast(low, dtype, shape, inf_sign="-")  # type: ignore
         high = _broadcast(high, dtype, shape, inf_sign="+")  # type: ignore
@@ -125,14 +130,46 @@ class Box(Space[np.ndarray]):
         dtype_precision = get_precision(self.dtype)
         if min(low_precision, high_precision) > dtype_precision:  # type: ignore
             logger.warn(f"Box bound precision lowered by casting to {self.dtype}")
-        self.low = low.astype(self.dtype)
-        self.high = high.astype(self.dtype)
+        self.low = low.astype(self.dtype, copy=not low_is_scalar)
+        self.high = high.astype(self.dtype, copy=not high_is_scalar)
 
         self.low_repr = _short_repr(self.low)
         self.high_repr = _short_repr(self.high)
 
+        self._init_sample_counts()
+
         super().__init__(self.shape, self.dtype, seed)
 
+    def _init_sample_counts(self):
+        """Caches the number of coordinates of each interval type, these only depend on the bounds."""
+        bounded = self.bounded_below & self.bounded_above
+        unbounded = ~(self.bounded_below | self.bounded_above)
+        self._bounded_count = int(np.count_nonzero(bounded))
+        self._unbounded_count = int(np.count_nonzero(unbounded))
+        self._low_bounded_count = (
+            int(np.count_nonzero(self.bounded_below)) - self._bounded_count
+        )
+        self._upp_bounded_count = (
+            int(np.count_nonzero(self.bounded_above)) - self._bounded_count
+        )
+        self._fully_bounded = self._bounded_count == bounded.size
+        self._fully_unbounded = self._unbounded_count == unbounded.size
+
+        # The per-coordinate masks are only needed with mixed bounds, see `_get_sample_masks`
+        self._sample_masks = None
+
+    def _get_sample_masks(self):
+        """Returns the unbounded, upper bounded, lower bounded and bounded coordinate masks, built on first use."""
+        if getattr(self, "_sample_masks", None) is None:
+            below, above = self.bounded_below, self.bounded_above
+            self._sample_masks = (
+                ~below & ~above,
+                ~below & above,
+                below & ~above,
+                below & above,
+            )
+        return self._sample_masks
+
     @property
     def shape(self) -> Tuple[int, ...]:
         """Has stricter type than gym.Space - never None."""
@@ -191,35 +228,38 @@ class Box(Space[np.ndarray]):
             )
 
         high = self.high if self.dtype.kind == "f" else self.high.astype("int64") + 1
-        sample = np.empty(self.shape)
 
-        # Masking arrays which classify the coordinates according to interval
-        # type
-        unbounded = ~self.bounded_below & ~self.bounded_above
-        upp_bounded = ~self.bounded_below & self.bounded_above
-        low_bounded = self.bounded_below & ~self.bounded_above
-        bounded = self.bounded_below & self.bounded_above
+        if self._fully_bounded:
+            # The common case, every coordinate is sampled from a single uniform draw
+            sample = self.np_random.uniform(low=self.low, high=high, size=self.shape)
+        elif self._fully_unbounded:
+            sample = self.np_random.standard_normal(size=self.shape)
+        else:
+            sample = np.empty(self.shape)
+            unbounded, upp_bounded, low_bounded, bounded = self._get_sample_masks()
 
-        # Vectorized sampling by interval type
-        sample[unbounded] = self.np_random.normal(size=unbounded[unbounded].shape)
+            # Vectorized sampling by interval type
+            sample[unbounded] = self.np_random.standard_normal(
+                size=self._unbounded_count
+            )
 
-        sample[low_bounded] = (
-            self.np_random.exponential(size=low_bounded[low_bounded].shape)
-            + self.low[low_bounded]
-        )
+            sample[low_bounded] = (
+                self.np_random.standard_exponential(size=self._low_bounded_count)
+                + self.low[low_bounded]
+            )
 
-        sample[upp_bounded] = (
-            -self.np_random.exponential(size=upp_bounded[upp_bounded].shape)
-            + self.high[upp_bounded]
-        )
+            sample[upp_bounded] = (
+                -self.np_random.standard_exponential(size=self._upp_bounded_count)
+                + self.high[upp_bounded]
+            )
 
-        sample[bounded] = self.np_random.uniform(
-            low=self.low[bounded], high=high[bounded], size=bounded[bounded].shape
-        )
+            sample[bounded] = self.np_random.uniform(
+                low=self.low[bounded], high=high[bounded], size=self._bounded_count
+            )
         if self.dtype.kind == "i":
-            sample = np.floor(sample)
+            np.floor(sample, out=sample)
 
-        return sample.astype(self.dtype)
+        return sample.astype(self.dtype, copy=False)
 
     def contains(self, x) -> bool:
         """Return boolean specifying if x is a valid member of this space."""
@@ -231,10 +271,10 @@ class Box(Space[np.ndarray]):
                 return False
 
         return bool(
-            np.can_cast(x.dtype, self.dtype)
-            and x.shape == self.shape
-            and np.all(x >= self.low)
-            and np.all(x <= self.high)
+            x.shape == self.shape
+            and np.can_cast(x.dtype, self.dtype)
+            and (x >= self.low).all()
+            and (x <= self.high).all()
         )
 
     def to_jsonable(self, sample_n):
@@ -277,6 +317,10 @@ class Box(Space[np.ndarray]):
         if not hasattr(self, "high_repr"):
             self.high_repr = _short_repr(self.high)
 
+        # legacy support through re-computing the interval counts if missing from pickled state
+        if not hasattr(self, "_fully_unbounded"):
+            self._init_sample_counts()
+
 
 def get_inf(dtype, sign: str) -> SupportsFloat:
     """Returns an infinite that doesn't break things.
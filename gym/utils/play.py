@@ -338,7 +338,11 @@ class PlayPlot:
         for axis, name in zip(self.ax, plot_names):
             axis.set_title(name)
         self.t = 0
-        self.cur_plot: List[Optional[plt.Axes]] = [None for _ in range(num_plots)]
+        # The plotted points are updated in place rather than re-creating an artist on every callback
+        self.cur_plot: List[plt.Line2D] = [
+            axis.plot([], [], linestyle="", marker="o", color="blue")[0]
+            for axis in self.ax
+        ]
         self.data = [deque(maxlen=horizon_timesteps) for _ in range(num_plots)]
 
     def callback(
@@ -371,13 +375,11 @@ class PlayPlot:
 
         xmin, xmax = max(0, self.t - self.horizon_timesteps), self.t
 
-        for i, plot in enumerate(self.cur_plot):
-            if plot is not None:
-                plot.remove()
-            self.cur_plot[i] = self.ax[i].scatter(
-                range(xmin, xmax), list(self.data[i]), c="blue"
-            )
-            self.ax[i].set_xlim(xmin, xmax)
+        for plot, axis, data_series in zip(self.cur_plot, self.ax, self.data):
+            plot.set_data(range(xmin, xmax), data_series)
+            axis.relim()
+            axis.autoscale_view(scalex=False)
+            axis.set_xlim(xmin, xmax)
 
         if plt is None:
             raise DependencyNotInstalled(
@@ -13,6 +13,9 @@ except ImportError:
     )
 
 
+_CUBIC_EPISODE_IDS = frozenset(k**3 for k in range(10))
+
+
 def capped_cubic_video_schedule(episode_id: int) -> bool:
     """The default episode trigger.
 
@@ -25,7 +28,7 @@ def capped_cubic_video_schedule(episode_id: int) -> bool:
         If to apply a video schedule number
     """
     if episode_id < 1000:
-        return int(round(episode_id ** (1.0 / 3))) ** 3 == episode_id
+        return episode_id in _CUBIC_EPISODE_IDS
     else:
         return episode_id % 1000 == 0
 
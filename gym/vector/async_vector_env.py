@@ -4,6 +4,7 @@ import sys
 import time
 from copy import deepcopy
 from enum import Enum
+from multiprocessing.connection import wait
 from typing import List, Optional, Sequence, Tuple, Union
 
 import numpy as np
@@ -137,6 +138,10 @@ class AsyncVectorEnv(VectorEnv):
                 self.single_observation_space, n=self.num_envs, fn=np.zeros
             )
 
+        self._rewards = np.zeros((self.num_envs,), dtype=np.float64)
+        self._terminateds = np.zeros((self.num_envs,), dtype=np.bool_)
+        self._truncateds = np.zeros((self.num_envs,), dtype=np.bool_)
+
         self.parent_pipes, self.processes = [], []
         self.error_queue = ctx.Queue()
         target = _worker_shared_memory if self.shared_memory else _worker
@@ -314,18 +319,21 @@ class AsyncVectorEnv(VectorEnv):
                 f"The call to `step_wait` has timed out after {timeout} second(s)."
             )
 
-        observations_list, rewards, terminateds, truncateds, infos = [], [], [], [], {}
+        observations_list, infos = [], {}
         successes = []
         for i, pipe in enumerate(self.parent_pipes):
             result, success = pipe.recv()
-            obs, rew, terminated, truncated, info = result
-
             successes.append(success)
-            observations_list.append(obs)
-            rewards.append(rew)
-            terminateds.append(terminated)
-            truncateds.append(truncated)
-            infos = self._add_info(infos, info, i)
+            if success:
+                (
+                    obs,
+                    self._rewards[i],
+                    self._terminateds[i],
+                    self._truncateds[i],
+                    info,
+                ) = result
+                observations_list.append(obs)
+                infos = self._add_info(infos, info, i)
 
         self._raise_if_errors(successes)
         self._state = AsyncState.DEFAULT
@@ -339,9 +347,9 @@ class AsyncVectorEnv(VectorEnv):
 
         return (
             deepcopy(self.observations) if self.copy else self.observations,
-            np.array(rewards),
-            np.array(terminateds, dtype=np.bool_),
-            np.array(truncateds, dtype=np.bool_),
+            np.copy(self._rewards),
+            np.copy(self._terminateds),
+            np.copy(self._truncateds),
             infos,
         )
 
@@ -484,14 +492,16 @@ class AsyncVectorEnv(VectorEnv):
         self._assert_is_running()
         if timeout is None:
             return True
+        if any(pipe is None or pipe.closed for pipe in self.parent_pipes):
+            return False
         end_time = time.perf_counter() + timeout
-        delta = None
-        for pipe in self.parent_pipes:
+        pending = list(self.parent_pipes)
+        while pending:
             delta = max(end_time - time.perf_counter(), 0)
-            if pipe is None:
-                return False
-            if pipe.closed or (not pipe.poll(delta)):
+            ready = wait(pending, delta)
+            if not ready:
                 return False
+            pending = [pipe for pipe in pending if pipe not in ready]
         return True
 
     def _check_spaces(self):
@@ -527,18 +537,19 @@ class AsyncVectorEnv(VectorEnv):
 
         num_errors = self.num_envs - sum(successes)
         assert num_errors > 0
-        for i in range(num_errors):
+        messages = []
+        for _ in range(num_errors):
             index, exctype, value = self.error_queue.get()
-            logger.error(
-                f"Received the following error from Worker-{index}: {exctype.__name__}: {value}"
+            messages.append(
+                f"Received the following error from Worker-{index}: {exctype.__name__}: {value}\n"
+                f"Shutting down Worker-{index}."
             )
-            logger.error(f"Shutting down Worker-{index}.")
             self.parent_pipes[index].close()
             self.parent_pipes[index] = None
 
-            if i == num_errors - 1:
-                logger.error("Raising the last exception back to the main process.")
-                raise exctype(value)
+        messages.append("Raising the last exception back to the main process.")
+        logger.error("%s", "\n".join(messages))
+        raise exctype(value)
 
     def __del__(self):
         """On deleting the object, checks that the vector environment is closed."""
@@ -607,7 +618,8 @@ def _worker(index, env_fn, pipe, parent_pipe, shared_memory, error_queue):
                     "`_setattr`, `_check_spaces`}."
                 )
     except (KeyboardInterrupt, Exception):
-        error_queue.put((index,) + sys.exc_info()[:2])
+        exctype, value = sys.exc_info()[:2]
+        error_queue.put((index, exctype, str(value)))
         pipe.send((None, False))
     finally:
         env.close()
@@ -678,7 +690,8 @@ def _worker_shared_memory(index, env_fn, pipe, parent_pipe, shared_memory, error
                     "`_setattr`, `_check_spaces`}."
                 )
     except (KeyboardInterrupt, Exception):
-        error_queue.put((index,) + sys.exc_info()[:2])
+        exctype, value = sys.exc_info()[:2]
+        error_queue.put((index, exctype, str(value)))
         pipe.send((None, False))
     finally:
         env.close()
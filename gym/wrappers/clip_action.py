@@ -37,4 +37,5 @@ class ClipAction(ActionWrapper):
         Returns:
             The clipped action
         """
-        return np.clip(action, self.action_space.low, self.action_space.high)
+        action_space = self.action_space
+        return np.clip(action, action_space.low, action_space.high)
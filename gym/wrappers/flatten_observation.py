@@ -1,4 +1,6 @@
 """Wrapper for flattening observations of an environment."""
+import numpy as np
+
 import gym
 import gym.spaces as spaces
 
@@ -27,6 +29,12 @@ class FlattenObservation(gym.ObservationWrapper):
         """
         super().__init__(env)
         self.observation_space = spaces.flatten_space(env.observation_space)
+        # Box observations are flattened directly, skipping the `flatten` dispatch
+        self._box_dtype = (
+            env.observation_space.dtype
+            if isinstance(env.observation_space, spaces.Box)
+            else None
+        )
 
     def observation(self, observation):
         """Flattens an observation.
@@ -37,4 +45,6 @@ class FlattenObservation(gym.ObservationWrapper):
         Returns:
             The flattened observation
         """
+        if self._box_dtype is not None:
+            return np.asarray(observation, dtype=self._box_dtype).flatten()
         return spaces.flatten(self.env.observation_space, observation)
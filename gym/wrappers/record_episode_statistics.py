@@ -114,29 +114,27 @@ class RecordEpisodeStatistics(gym.Wrapper):
         ), f"`info` dtype is {type(infos)} while supported dtype is `dict`. This may be due to usage of other wrappers in the wrong order."
         self.episode_returns += rewards
         self.episode_lengths += 1
-        if not self.is_vector_env:
-            terminateds = [terminateds]
-            truncateds = [truncateds]
-        terminateds = list(terminateds)
-        truncateds = list(truncateds)
-
-        for i in range(len(terminateds)):
-            if terminateds[i] or truncateds[i]:
+        # Only visit the sub-environments whose episode just ended
+        if self.is_vector_env:
+            done_indices = np.flatnonzero(np.logical_or(terminateds, truncateds))
+        else:
+            done_indices = (0,) if terminateds or truncateds else ()
+        if len(done_indices) > 0:
+            elapsed_time = round(time.perf_counter() - self.t0, 6)
+            for i in done_indices:
                 episode_return = self.episode_returns[i]
                 episode_length = self.episode_lengths[i]
                 episode_info = {
-                    "episode": {
-                        "r": episode_return,
-                        "l": episode_length,
-                        "t": round(time.perf_counter() - self.t0, 6),
-                    }
+                    "r": episode_return,
+                    "l": episode_length,
+                    "t": elapsed_time,
                 }
                 if self.is_vector_env:
                     infos = add_vector_episode_statistics(
-                        infos, episode_info["episode"], self.num_envs, i
+                        infos, episode_info, self.num_envs, i
                     )
                 else:
-                    infos = {**infos, **episode_info}
+                    infos = {**infos, "episode": episode_info}
                 self.return_queue.append(episode_return)
                 self.length_queue.append(episode_length)
                 self.episode_count += 1
@@ -145,7 +143,7 @@ class RecordEpisodeStatistics(gym.Wrapper):
         return (
             observations,
             rewards,
-            terminateds if self.is_vector_env else terminateds[0],
-            truncateds if self.is_vector_env else truncateds[0],
+            list(terminateds) if self.is_vector_env else terminateds,
+            list(truncateds) if self.is_vector_env else truncateds,
             infos,
         )
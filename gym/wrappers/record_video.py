@@ -6,6 +6,8 @@ import gym
 from gym import logger
 from gym.wrappers.monitoring import video_recorder
 
+_CUBIC_EPISODE_IDS = frozenset(k**3 for k in range(10))
+
 
 def capped_cubic_video_schedule(episode_id: int) -> bool:
     """The default episode trigger.
@@ -19,7 +21,7 @@ def capped_cubic_video_schedule(episode_id: int) -> bool:
         If to apply a video schedule number
     """
     if episode_id < 1000:
-        return int(round(episode_id ** (1.0 / 3))) ** 3 == episode_id
+        return episode_id in _CUBIC_EPISODE_IDS
     else:
         return episode_id % 1000 == 0
 
@@ -71,12 +73,15 @@ class RecordVideo(gym.Wrapper):
 
         self.video_folder = os.path.abspath(video_folder)
         # Create output folder if needed
-        if os.path.isdir(self.video_folder):
+        try:
+            os.makedirs(self.video_folder)
+        except FileExistsError:
+            if not os.path.isdir(self.video_folder):
+                raise
             logger.warn(
                 f"Overwriting existing videos at {self.video_folder} folder "
                 f"(try specifying a different `video_folder` for the `RecordVideo` wrapper if this is not desired)"
             )
-        os.makedirs(self.video_folder, exist_ok=True)
 
         self.name_prefix = name_prefix
         self.step_id = 0
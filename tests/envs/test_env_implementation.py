@@ -126,6 +126,17 @@ def test_frozenlake_dfs_map_generation(map_size: int):
     raise AssertionError("No path through the frozenlake was found.")
 
 
+@pytest.mark.parametrize("map_size, seed", [(5, 123), (10, 42), (16, 987)])
+def test_frozenlake_map_generation_with_seed(map_size: int, seed: int):
+    """Tests that the generated frozenlake map is reproducible when seeded."""
+    map1 = generate_random_map(size=map_size, seed=seed)
+    map2 = generate_random_map(size=map_size, seed=seed)
+    assert map1 == map2
+
+    map3 = generate_random_map(size=map_size, seed=seed + 1)
+    assert map1 != map3
+
+
 def test_taxi_action_mask():
     env = TaxiEnv()
 
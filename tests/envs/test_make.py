@@ -46,6 +46,29 @@ gym.register(
 )
 
 
+HUMANOID_V0_DEPRECATED_RE = re.compile(
+    re.escape(
+        "Environment version v0 for `Humanoid` is deprecated. Please use `Humanoid-v4` instead."
+    )
+)
+HUMAN_RENDERING_WRAPPER_RE = re.compile(
+    re.escape(
+        "You are trying to use 'human' rendering for an environment that doesn't natively support it. The HumanRendering wrapper is being applied to your environment."
+    )
+)
+UNEXPECTED_RENDER_MODE_KWARG_RE = re.compile(
+    re.escape("got an unexpected keyword argument 'render_mode'")
+)
+NO_HUMAN_OLD_API_RE = re.compile(
+    re.escape(
+        "You passed render_mode='human' although test/NoHumanOldAPI-v0 doesn't implement human-rendering natively."
+    )
+)
+UNEXPECTED_RENDER_KWARG_RE = re.compile(
+    re.escape("got an unexpected keyword argument 'render'")
+)
+
+
 def test_make():
     env = gym.make("CartPole-v1", disable_env_checker=True)
     assert env.spec.id == "CartPole-v1"
@@ -55,12 +78,7 @@ def test_make():
 
 def test_make_deprecated():
     with warnings.catch_warnings(record=True):
-        with pytest.raises(
-            gym.error.Error,
-            match=re.escape(
-                "Environment version v0 for `Humanoid` is deprecated. Please use `Humanoid-v4` instead."
-            ),
-        ):
+        with pytest.raises(gym.error.Error, match=HUMANOID_V0_DEPRECATED_RE):
             gym.make("Humanoid-v0", disable_env_checker=True)
 
 
@@ -242,9 +260,7 @@ def test_make_render_mode():
 
     with pytest.warns(
         UserWarning,
-        match=re.escape(
-            "You are trying to use 'human' rendering for an environment that doesn't natively support it. The HumanRendering wrapper is being applied to your environment."
-        ),
+        match=HUMAN_RENDERING_WRAPPER_RE,
     ):
         # Make sure that `HumanRendering` is applied here
         env = gym.make(
@@ -254,9 +270,7 @@ def test_make_render_mode():
         assert env.render_mode == "human"
         env.close()
 
-    with pytest.raises(
-        TypeError, match=re.escape("got an unexpected keyword argument 'render_mode'")
-    ):
+    with pytest.raises(TypeError, match=UNEXPECTED_RENDER_MODE_KWARG_RE):
         gym.make(
             "test/NoHumanOldAPI-v0",
             render_mode="rgb_array_list",
@@ -267,9 +281,7 @@ def test_make_render_mode():
     with warnings.catch_warnings(record=True):
         with pytest.raises(
             gym.error.Error,
-            match=re.escape(
-                "You passed render_mode='human' although test/NoHumanOldAPI-v0 doesn't implement human-rendering natively."
-            ),
+            match=NO_HUMAN_OLD_API_RE,
         ):
             gym.make(
                 "test/NoHumanOldAPI-v0", render_mode="human", disable_env_checker=True
@@ -278,10 +290,7 @@ def test_make_render_mode():
     # This test ensures that the additional exception "Gym tried to apply the HumanRendering wrapper but it looks like
     # your environment is using the old rendering API" is *not* triggered by a TypeError that originate from
     # a keyword that is not `render_mode`
-    with pytest.raises(
-        TypeError,
-        match=re.escape("got an unexpected keyword argument 'render'"),
-    ):
+    with pytest.raises(TypeError, match=UNEXPECTED_RENDER_KWARG_RE):
         gym.make("CarRacing-v2", render="human")
 
 
@@ -6,8 +6,11 @@ import pytest
 
 import gym
 
+# `make` copies the spec kwargs before using them, so the registered specs can share this dict
+ARGUMENT_ENV_KWARGS = {"arg1": "arg1", "arg2": "arg2", "arg3": "arg3"}
 
-@pytest.fixture(scope="function")
+
+@pytest.fixture(scope="module")
 def register_testing_envs():
     """Registers testing environments."""
     namespace = "MyAwesomeNamespace"
@@ -19,20 +22,12 @@ def register_testing_envs():
         gym.register(
             id=env_id,
             entry_point="tests.envs.utils_envs:ArgumentEnv",
-            kwargs={
-                "arg1": "arg1",
-                "arg2": "arg2",
-                "arg3": "arg3",
-            },
+            kwargs=ARGUMENT_ENV_KWARGS,
         )
     gym.register(
         id=f"{namespace}/{unversioned_name}",
         entry_point="tests.env.utils_envs:ArgumentEnv",
-        kwargs={
-            "arg1": "arg1",
-            "arg2": "arg2",
-            "arg3": "arg3",
-        },
+        kwargs=ARGUMENT_ENV_KWARGS,
     )
 
     yield
@@ -72,7 +67,7 @@ def test_register(
     if version is not None:
         full_name = f"{full_name}-v{version}"
 
-    assert full_name in gym.envs.registry.keys()
+    assert full_name in gym.envs.registry
 
     del gym.envs.registry[env_id]
 
@@ -196,3 +191,23 @@ def test_namespace():
 
     del gym.envs.registry["MyDefaultNamespace/MyDefaultEnvironment-v0"]
     del gym.envs.registry["MyDefaultEnvironment-v1"]
+
+
+def test_registry_index():
+    registry = gym.envs.registry
+    gym.register("Test/IndexedEnv-v0", "no-entry-point")
+    gym.register("Test/IndexedEnv-v2", "no-entry-point")
+    assert {spec.id for spec in registry.env_specs("Test", "IndexedEnv")} == {
+        "Test/IndexedEnv-v0",
+        "Test/IndexedEnv-v2",
+    }
+    assert gym.envs.registration.find_highest_version("Test", "IndexedEnv") == 2
+
+    del registry["Test/IndexedEnv-v2"]
+    assert gym.envs.registration.find_highest_version("Test", "IndexedEnv") == 0
+
+    registry.pop("Test/IndexedEnv-v0")
+    assert registry.env_specs("Test", "IndexedEnv") == []
+    assert "Test" not in registry.namespaces()
+    with pytest.raises(gym.error.NamespaceNotFound):
+        gym.spec("Test/IndexedEnv-v0")
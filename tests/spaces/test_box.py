@@ -314,3 +314,19 @@ def test_sample_mask():
         match=re.escape("Box.sample cannot be provided a mask, actual value: "),
     ):
         space.sample(mask=np.array([0, 1, 0], dtype=np.int8))
+
+
+@pytest.mark.parametrize(
+    "space",
+    [
+        Box(low=-5, high=5, shape=(), dtype=np.int64),
+        Box(low=-5, high=np.inf, shape=(), dtype=np.int64),
+        Box(low=-1.0, high=1.0, shape=(), dtype=np.float32),
+    ],
+)
+def test_sample_scalar_shape(space):
+    """Tests that sampling a Box with an empty shape returns a zero-dimensional array in the space."""
+    sample = space.sample()
+    assert isinstance(sample, np.ndarray)
+    assert sample.shape == () and sample.dtype == space.dtype
+    assert sample in space
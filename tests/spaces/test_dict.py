@@ -1,3 +1,4 @@
+import warnings
 from collections import OrderedDict
 
 import numpy as np
@@ -25,18 +26,20 @@ def test_dict_init():
     ):
         Dict(a=Discrete(2), b="Box")
 
-    with pytest.warns(None) as warnings:
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter("always")
         a = Dict({"a": Discrete(2), "b": Box(low=0.0, high=1.0)})
         b = Dict(OrderedDict(a=Discrete(2), b=Box(low=0.0, high=1.0)))
         c = Dict((("a", Discrete(2)), ("b", Box(low=0.0, high=1.0))))
         d = Dict(a=Discrete(2), b=Box(low=0.0, high=1.0))
 
         assert a == b == c == d
-    assert len(warnings) == 0
+    assert len(caught_warnings) == 0
 
-    with pytest.warns(None) as warnings:
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter("always")
         Dict({1: Discrete(2), "a": Discrete(3)})
-    assert len(warnings) == 0
+    assert len(caught_warnings) == 0
 
 
 DICT_SPACE = Dict(
@@ -72,12 +75,21 @@ def test_dict_seeding():
     b_2 = Box(low=-1, high=1, shape=(2,), seed=2)
     c = Discrete(5, seed=3)
 
-    for i in range(10):
-        dict_sample = DICT_SPACE.sample()
-        assert np.all(dict_sample["a"] == a.sample())
-        assert np.all(dict_sample["b"]["b_1"] == b_1.sample())
-        assert np.all(dict_sample["b"]["b_2"] == b_2.sample())
-        assert dict_sample["c"] == c.sample()
+    dict_samples = [DICT_SPACE.sample() for _ in range(10)]
+    assert np.array_equal(
+        [sample["a"] for sample in dict_samples], [a.sample() for _ in range(10)]
+    )
+    assert np.array_equal(
+        [sample["b"]["b_1"] for sample in dict_samples],
+        [b_1.sample() for _ in range(10)],
+    )
+    assert np.array_equal(
+        [sample["b"]["b_2"] for sample in dict_samples],
+        [b_2.sample() for _ in range(10)],
+    )
+    assert np.array_equal(
+        [sample["c"] for sample in dict_samples], [c.sample() for _ in range(10)]
+    )
 
 
 def test_int_seeding():
@@ -95,12 +107,21 @@ def test_int_seeding():
     b_2 = Box(low=-1, high=1, shape=(2,), seed=seeds[4])
     c = Discrete(5, seed=seeds[5])
 
-    for i in range(10):
-        dict_sample = DICT_SPACE.sample()
-        assert np.all(dict_sample["a"] == a.sample())
-        assert np.all(dict_sample["b"]["b_1"] == b_1.sample())
-        assert np.all(dict_sample["b"]["b_2"] == b_2.sample())
-        assert dict_sample["c"] == c.sample()
+    dict_samples = [DICT_SPACE.sample() for _ in range(10)]
+    assert np.array_equal(
+        [sample["a"] for sample in dict_samples], [a.sample() for _ in range(10)]
+    )
+    assert np.array_equal(
+        [sample["b"]["b_1"] for sample in dict_samples],
+        [b_1.sample() for _ in range(10)],
+    )
+    assert np.array_equal(
+        [sample["b"]["b_2"] for sample in dict_samples],
+        [b_2.sample() for _ in range(10)],
+    )
+    assert np.array_equal(
+        [sample["c"] for sample in dict_samples], [c.sample() for _ in range(10)]
+    )
 
 
 def test_none_seeding():
@@ -9,6 +9,8 @@ from gym.spaces import Box, Discrete, MultiDiscrete, Tuple
 from gym.vector.async_vector_env import AsyncVectorEnv
 from tests.vector.utils import (
     CustomSpace,
+    UnpicklableError,
+    UnpicklableErrorEnv,
     make_custom_space_env,
     make_env,
     make_slow_env,
@@ -272,6 +274,15 @@ def test_check_spaces_async_vector_env(shared_memory):
         env.close(terminate=True)
 
 
+@pytest.mark.parametrize("shared_memory", [True, False])
+def test_unpicklable_error_async_vector_env(shared_memory):
+    env = AsyncVectorEnv([UnpicklableErrorEnv] * 2, shared_memory=shared_memory)
+    env.reset()
+    with pytest.raises(UnpicklableError, match="step failed"):
+        env.step(env.action_space.sample())
+    env.close(terminate=True)
+
+
 def test_custom_space_async_vector_env():
     env_fns = [make_custom_space_env(i) for i in range(4)]
 
@@ -1,3 +1,4 @@
+import threading
 import time
 from typing import Optional
 
@@ -107,6 +108,26 @@ class CustomSpaceEnv(gym.Env):
         return observation, reward, terminated, truncated, {}
 
 
+class UnpicklableError(Exception):
+    def __init__(self, message):
+        super().__init__(message)
+        self.lock = threading.Lock()
+
+
+class UnpicklableErrorEnv(gym.Env):
+    def __init__(self):
+        super().__init__()
+        self.observation_space = Box(low=0.0, high=1.0, shape=(), dtype=np.float64)
+        self.action_space = Discrete(2)
+
+    def reset(self, *, seed: Optional[int] = None, options: Optional[dict] = None):
+        super().reset(seed=seed)
+        return 0.0, {}
+
+    def step(self, action):
+        raise UnpicklableError("step failed")
+
+
 def make_env(env_name, seed, **kwargs):
     def _make():
         env = gym.make(env_name, disable_env_checker=True, **kwargs)
@@ -17,12 +17,11 @@ def test_clip_action():
     wrapped_env.reset(seed=seed)
 
     actions = [[0.4], [1.2], [-0.3], [0.0], [-2.5]]
-    for action in actions:
-        obs1, r1, ter1, trunc1, _ = env.step(
-            np.clip(action, env.action_space.low, env.action_space.high)
-        )
+    clipped_actions = np.clip(actions, env.action_space.low, env.action_space.high)
+    for action, clipped_action in zip(actions, clipped_actions):
+        obs1, r1, ter1, trunc1, _ = env.step(clipped_action)
         obs2, r2, ter2, trunc2, _ = wrapped_env.step(action)
-        assert np.allclose(r1, r2)
-        assert np.allclose(obs1, obs2)
+        assert r1 == r2
+        assert np.array_equal(obs1, obs2)
         assert ter1 == ter2
         assert trunc1 == trunc2
@@ -21,3 +21,15 @@ def test_flatten_observation(env_id):
     assert wrapped_space.contains(wrapped_obs)
     assert isinstance(info, dict)
     assert isinstance(wrapped_obs_info, dict)
+
+
+def test_flatten_box_observation():
+    env = gym.make("Pendulum-v1", disable_env_checker=True)
+    wrapped_env = FlattenObservation(env)
+
+    obs = env.observation_space.sample()
+    wrapped_obs = wrapped_env.observation(obs)
+
+    assert wrapped_env.observation_space.contains(wrapped_obs)
+    assert np.array_equal(wrapped_obs, obs.flatten())
+    assert not np.shares_memory(wrapped_obs, obs)